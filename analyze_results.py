@@ -0,0 +1,190 @@
+"""Aggregate the *RESULT metric trees into a single comparison report.
+
+Every benchmark run writes one CSV per try under
+``<CIPHER>RESULT/<SIZE>_READING/<N>LOOPS/``.  This module loads all of them
+in one pass into a single pandas DataFrame, computes latency percentiles,
+throughput, memory and CPU per cipher x size x loop count x operation, and
+compares the tries against each other.
+
+Usage:
+    python analyze_results.py [--root .] [--output RESULTS_REPORT.csv]
+"""
+
+import argparse
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+RESULT_SUFFIX = "RESULT"
+COLUMNS = [
+    "operation",
+    "iteration_number",
+    "file_size_label",
+    "cpu_percent",
+    "memory_used_mb",
+    "process_time_sec",
+    "encrypted_size_bytes",
+    "entropy",
+]
+NUMERIC_COLUMNS = COLUMNS[3:] + ["iteration_number"]
+GROUP_KEYS = ["cipher", "file_size", "loops", "operation"]
+
+LOOPS_PATTERN = re.compile(r"(\d+)LOOPS", re.IGNORECASE)
+TRY_PATTERN = re.compile(r"_(\d+)(?:st|nd|rd|th)?try", re.IGNORECASE)
+
+
+def calculate_entropy(data):
+    """Shannon entropy in bits per byte, counted with np.bincount."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if buf.size == 0:
+        return 0.0
+    counts = np.bincount(buf, minlength=256)
+    probs = counts[counts > 0] / buf.size
+    return float(-(probs * np.log2(probs)).sum())
+
+
+def find_result_files(root="."):
+    """Yield (cipher, loops, try_number, path) for every metrics CSV."""
+    for entry in sorted(os.listdir(root)):
+        top = os.path.join(root, entry)
+        if not (entry.endswith(RESULT_SUFFIX) and os.path.isdir(top)):
+            continue
+        cipher = entry[: -len(RESULT_SUFFIX)]
+        for dirpath, _, filenames in os.walk(top):
+            loops_match = LOOPS_PATTERN.search(os.path.basename(dirpath))
+            if not loops_match:
+                continue
+            for name in sorted(filenames):
+                try_match = TRY_PATTERN.search(name)
+                if not name.endswith(".csv") or not try_match:
+                    continue
+                yield (
+                    cipher,
+                    int(loops_match.group(1)),
+                    int(try_match.group(1)),
+                    os.path.join(dirpath, name),
+                )
+
+
+def load_results(root="."):
+    """Load every metrics CSV under root into one columnar DataFrame.
+
+    Files are read headerless against the superset schema so truncated runs
+    (missing header, partial decrypt phase) and the extra Blowfish entropy
+    column all land in the same frame; stray header rows are dropped.
+    """
+    frames = []
+    for cipher, loops, try_number, path in find_result_files(root):
+        frame = pd.read_csv(path, header=None, names=COLUMNS, dtype=str)
+        frame["cipher"] = cipher
+        frame["loops"] = loops
+        frame["try_number"] = try_number
+        frame["source_file"] = os.path.relpath(path, root)
+        frames.append(frame)
+    if not frames:
+        raise FileNotFoundError(f"No *{RESULT_SUFFIX} metric CSVs found under {root!r}")
+
+    df = pd.concat(frames, ignore_index=True)
+    df = df[df["operation"].isin(["encryption", "decryption"])].copy()
+    df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    df["file_size"] = df["file_size_label"].str.replace(" file", "", regex=False)
+
+    # Decryption rows record the recovered plaintext length; use it as the
+    # payload size for both directions so throughput is comparable.
+    plaintext = (
+        df[df["operation"] == "decryption"]
+        .groupby("file_size")["encrypted_size_bytes"]
+        .median()
+    )
+    df["plaintext_bytes"] = df["file_size"].map(plaintext)
+    df["throughput_mb_s"] = (
+        df["plaintext_bytes"] / (1024 * 1024) / df["process_time_sec"]
+    ).replace([np.inf, -np.inf], np.nan)
+    return df.reset_index(drop=True)
+
+
+def _quantile(q):
+    def agg(series):
+        return series.quantile(q)
+
+    agg.__name__ = f"p{int(q * 100)}"
+    return agg
+
+
+def summarize(df):
+    """Per cipher x size x loops x operation latency, throughput, memory, CPU."""
+    grouped = df.groupby(GROUP_KEYS, sort=False)
+    summary = grouped.agg(
+        samples=("process_time_sec", "size"),
+        tries=("try_number", "nunique"),
+        latency_mean_s=("process_time_sec", "mean"),
+        latency_p50_s=("process_time_sec", _quantile(0.50)),
+        latency_p95_s=("process_time_sec", _quantile(0.95)),
+        latency_p99_s=("process_time_sec", _quantile(0.99)),
+        throughput_mb_s=("throughput_mb_s", "median"),
+        memory_mean_mb=("memory_used_mb", "mean"),
+        memory_max_mb=("memory_used_mb", "max"),
+        cpu_mean_percent=("cpu_percent", "mean"),
+        output_size_bytes=("encrypted_size_bytes", "median"),
+        entropy_mean=("entropy", "mean"),
+        plaintext_bytes=("plaintext_bytes", "first"),
+    )
+    # A full run has loops rows per try; fewer means a truncated CSV.
+    summary["complete"] = summary["samples"] == (
+        summary.index.get_level_values("loops") * summary["tries"]
+    )
+    return summary.reset_index()
+
+
+def compare_tries(df):
+    """Mean latency per try side by side, with the spread between tries."""
+    per_try = (
+        df.groupby(GROUP_KEYS + ["try_number"], sort=False)["process_time_sec"]
+        .mean()
+        .unstack("try_number")
+    )
+    per_try.columns = [f"try{n}_mean_s" for n in per_try.columns]
+    values = per_try.to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nanmean(values, axis=1)
+        per_try["try_cv_percent"] = np.nanstd(values, axis=1) / mean * 100
+        per_try["try_max_min_ratio"] = np.nanmax(values, axis=1) / np.nanmin(values, axis=1)
+    return per_try.reset_index()
+
+
+def build_report(df):
+    """Join the summary and the try comparison into one ordered table."""
+    report = summarize(df).merge(compare_tries(df), on=GROUP_KEYS, how="left")
+    report = report.sort_values(
+        ["operation", "plaintext_bytes", "loops", "cipher"], kind="stable"
+    )
+    return report.drop(columns="plaintext_bytes").reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=".", help="directory holding the *RESULT trees")
+    parser.add_argument("--output", default="RESULTS_REPORT.csv", help="report CSV to write")
+    args = parser.parse_args()
+
+    df = load_results(args.root)
+    report = build_report(df)
+    report.to_csv(args.output, index=False)
+
+    print(f"Loaded {len(df)} rows from {df['source_file'].nunique()} files")
+    incomplete = report[~report["complete"]]
+    if not incomplete.empty:
+        print("Incomplete runs (fewer rows than loops x tries):")
+        print(incomplete[GROUP_KEYS + ["samples", "tries"]].to_string(index=False))
+    view = report[GROUP_KEYS + ["latency_p50_s", "latency_p95_s", "throughput_mb_s", "try_cv_percent"]]
+    with pd.option_context("display.max_rows", None, "display.width", 160):
+        print(view.to_string(index=False, float_format="{:.4f}".format))
+    print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()